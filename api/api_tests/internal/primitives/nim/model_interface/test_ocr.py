@@ -4,12 +4,16 @@
 
 # noqa
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import patch
 import json
+import weakref
 import numpy as np
 
 # Import using the specified pattern
 import nv_ingest_api.internal.primitives.nim.model_interface.ocr as model_interface_module
+from nv_ingest_api.internal.primitives.nim.model_interface.ocr import NemoRetrieverOCRModelInterface
 from nv_ingest_api.internal.primitives.nim.model_interface.ocr import PaddleOCRModelInterface
 
 MODULE_UNDER_TEST = f"{model_interface_module.__name__}"
@@ -88,6 +92,38 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         for img in result["images"]:
             self.assertTrue(isinstance(img, np.ndarray))
 
+    def test_prepare_data_for_inference_preserves_order(self):
+        """Test that concurrently decoded images are returned in input order."""
+        self.mock_base64_to_numpy.side_effect = lambda b64: np.full((2, 2, 3), int(b64[-1]), dtype=np.uint8)
+        test_data = {"base64_images": self.sample_base64_list}
+        result = self.model_interface.prepare_data_for_inference(test_data)
+
+        self.assertEqual([int(img[0, 0, 0]) for img in result["images"]], [1, 2, 3])
+
+    def test_prepare_data_for_inference_decode_error(self):
+        """Test that a decoding failure for any image is propagated."""
+
+        def _decode(b64):
+            if b64 == "base64_image_2":
+                raise ValueError("Unable to decode image from base64 string")
+            return np.zeros((100, 200, 3), dtype=np.uint8)
+
+        self.mock_base64_to_numpy.side_effect = _decode
+        test_data = {"base64_images": self.sample_base64_list}
+        with self.assertRaises(ValueError) as context:
+            self.model_interface.prepare_data_for_inference(test_data)
+
+        self.assertTrue("Unable to decode" in str(context.exception))
+
+    def test_prepare_data_for_inference_already_decoded(self):
+        """Test that already-decoded images are passed through without decoding again."""
+        images = [np.zeros((10, 20, 3), dtype=np.uint8)]
+        test_data = {"base64_images": self.sample_base64_list[:1], "images": images}
+        result = self.model_interface.prepare_data_for_inference(test_data)
+
+        self.mock_base64_to_numpy.assert_not_called()
+        self.assertIs(result["images"], images)
+
     def test_prepare_data_for_inference_missing_data(self):
         """Test prepare_data_for_inference method with missing data."""
         test_data = {"some_other_key": "value"}
@@ -141,9 +177,36 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         self.assertEqual(len(batches), 2)  # Should have 2 batches (2 images in first, 1 in second)
         self.assertEqual(len(batch_data), 2)  # Should have 2 batch data dicts
 
+        # Each batch should be a single (B, C, H, W) float32 array
+        self.assertEqual(batches[0].shape, (2, 3, 32, 64))
+        self.assertEqual(batches[1].shape, (1, 3, 32, 64))
+        self.assertEqual(batches[0].dtype, np.float32)
+
         # Check that image_dims was updated
         self.assertEqual(len(test_data["image_dims"]), 3)
 
+    def test_format_input_grpc_does_not_keep_preprocessed_images(self):
+        """Test that each preprocessed image is released once it is copied into its batch buffer."""
+        produced = []
+        alive_at_call = []
+
+        def _preprocess(img, **kwargs):
+            # The image currently being copied may still be referenced; earlier ones must be gone.
+            alive_at_call.append(sum(ref() is not None for ref in produced))
+            arr = np.full((3, 32, 64), len(produced), dtype=np.float32)
+            produced.append(weakref.ref(arr))
+            return arr, {"new_height": 32, "new_width": 64}
+
+        self.mock_preprocess.side_effect = _preprocess
+        test_data = {"images": [np.zeros((100, 200, 3), dtype=np.uint8) for _ in range(4)]}
+
+        # Run the pool's map lazily on the calling thread so the check is deterministic.
+        with patch.object(model_interface_module, "_IMAGE_POOL", SimpleNamespace(map=map)):
+            batches, _ = self.model_interface.format_input(test_data, protocol="grpc", max_batch_size=4)
+
+        self.assertLessEqual(max(alive_at_call), 1)
+        self.assertEqual([int(batches[0][i, 0, 0, 0]) for i in range(4)], [0, 1, 2, 3])
+
     def test_format_input_http_single_image(self):
         """Test format_input method with HTTP protocol and a single image."""
         # Set up test data with image_arrays, empty image_dims, and base64_image
@@ -151,7 +214,7 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         test_data = {
             "images": [img_array],
             "image_dims": [],
-            "base64_images": self.sample_base64,
+            "base64_images": [self.sample_base64],
         }
 
         batches, batch_data = self.model_interface.format_input(test_data, protocol="http", max_batch_size=1)
@@ -202,6 +265,19 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         # Check that image_dims was updated
         self.assertEqual(len(test_data["image_dims"]), 3)
 
+    def test_format_input_http_uses_prepared_dims(self):
+        """Test that the HTTP branch reuses the dims recorded by prepare_data_for_inference."""
+        self.mock_base64_to_numpy.return_value = np.zeros((100, 200, 3), dtype=np.uint8)
+        test_data = self.model_interface.prepare_data_for_inference({"base64_images": self.sample_base64_list})
+        self.assertEqual(test_data["image_dims"], [{"new_width": 200, "new_height": 100}] * 3)
+
+        # Drop the images' shape information to make sure format_input does not touch them.
+        test_data["images"] = [object()] * 3
+        batches, batch_data = self.model_interface.format_input(test_data, protocol="http", max_batch_size=2)
+
+        self.assertEqual([len(b["input"]) for b in batches], [2, 1])
+        self.assertEqual(batch_data[1]["image_dims"], [{"new_width": 200, "new_height": 100}])
+
     def test_format_input_missing_data(self):
         """Test format_input method with missing data."""
         test_data = {"some_other_key": "value"}
@@ -271,6 +347,39 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         self.assertEqual(texts, ["Hello", "World"])
         self.assertEqual(len(conf_scores), 2)
 
+    def test_parse_output_http_scales_boxes(self):
+        """Test HTTP parsing scales stacked boxes and handles polygons with differing point counts."""
+
+        def detection(text, points):
+            return {
+                "text_prediction": {"text": text, "confidence": 0.5},
+                "bounding_box": {"points": [{"x": x, "y": y} for x, y in points]},
+            }
+
+        quad = [(0.1, 0.2), (0.3, 0.2), (0.3, 0.4), (0.1, 0.4)]
+        mock_response = {
+            "data": [
+                {"text_detections": [detection("A", quad), detection("B", quad)]},
+                {"text_detections": [detection("C", quad), detection("D", quad[:3])]},
+                {"text_detections": []},
+            ]
+        }
+        data = {"image_dims": [{"new_width": 100, "new_height": 200}] * 3}
+
+        result = self.model_interface.parse_output(mock_response, protocol="http", data=data)
+
+        stacked_boxes, texts, _ = result[0]
+        self.assertEqual(texts, ["A", "B"])
+        self.assertIsInstance(stacked_boxes, list)
+        self.assertAlmostEqual(stacked_boxes[1][2][0], 30.0)
+        self.assertAlmostEqual(stacked_boxes[1][2][1], 80.0)
+
+        ragged_boxes, texts, _ = result[1]
+        self.assertEqual(texts, ["C", "D"])
+        self.assertEqual([len(box) for box in ragged_boxes], [4, 3])
+
+        self.assertEqual(result[2], [[], [], []])
+
     def test_parse_output_http_missing_data(self):
         """Test parse_output method with HTTP protocol and missing data."""
         mock_response = {}  # Missing 'data' key
@@ -426,6 +535,57 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
             self.assertEqual(bboxes, [[0.1, 0.2], [0.3, 0.2], [0.3, 0.4], [0.1, 0.4]])
             self.assertEqual(texts, ["Single Image Text"])
 
+    def test_extract_content_from_ocr_grpc_response(self):
+        """Test parsing raw gRPC byte strings, with and without orjson available."""
+        # Shape (n, 3): the default model returns one row of (boxes, texts, confidences) per image.
+        mock_response = np.array(
+            [
+                [
+                    json.dumps([[[0.1, 0.2], [0.3, 0.2], [0.3, 0.4], [0.1, 0.4]]]).encode("utf8"),
+                    json.dumps(["Sample Text"]).encode("utf8"),
+                    json.dumps([0.95]).encode("utf8"),
+                ]
+            ],
+            dtype=object,
+        )
+        dims = [{"new_width": 100, "new_height": 200}]
+
+        for orjson_module in (model_interface_module.orjson, None):
+            with patch(f"{MODULE_UNDER_TEST}.orjson", orjson_module):
+                result = self.model_interface._extract_content_from_ocr_grpc_response(mock_response, dims)
+
+            self.assertEqual(len(result), 1)
+            bboxes, texts, conf_scores = result[0]
+            self.assertEqual(texts, ["Sample Text"])
+            self.assertEqual(conf_scores, [0.95])
+            self.assertAlmostEqual(bboxes[0][0][0], 10.0, places=4)
+            self.assertAlmostEqual(bboxes[0][0][1], 40.0, places=4)
+
+    def test_extract_content_from_ocr_grpc_response_nested_outputs(self):
+        """Test that singly nested gRPC outputs are flattened only when all three are nested."""
+        box = [[0.1, 0.2], [0.3, 0.2], [0.3, 0.4], [0.1, 0.4]]
+        mock_response = np.array(
+            [
+                [
+                    json.dumps([[box]]).encode("utf8"),
+                    json.dumps([["Sample Text"]]).encode("utf8"),
+                    json.dumps([[0.95]]).encode("utf8"),
+                ],
+                [
+                    json.dumps([box]).encode("utf8"),
+                    json.dumps([["Sample Text"]]).encode("utf8"),
+                    json.dumps([0.95]).encode("utf8"),
+                ],
+            ],
+            dtype=object,
+        )
+        dims = [{"new_width": 100, "new_height": 200}] * 2
+
+        result = self.model_interface._extract_content_from_ocr_grpc_response(mock_response, dims)
+
+        self.assertEqual(result[0][1:], [["Sample Text"], [0.95]])
+        self.assertEqual(result[1][1:], [[["Sample Text"]], [0.95]])
+
     def test_parse_output_grpc_invalid_response_type(self):
         """Test parse_output method with gRPC protocol and an invalid response type."""
         mock_response = "not a numpy array"
@@ -453,6 +613,31 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         result = self.model_interface.process_inference_results(test_output)
         self.assertEqual(result, test_output)
 
+    def test_get_grpc_client_reuses_client_per_endpoint(self):
+        """Test that Triton clients are created once per endpoint and then reused."""
+        with patch(f"{MODULE_UNDER_TEST}.grpcclient.InferenceServerClient") as mock_client_cls, patch.dict(
+            model_interface_module._CLIENTS, clear=True
+        ):
+            mock_client_cls.side_effect = lambda endpoint: SimpleNamespace(endpoint=endpoint)
+
+            first = model_interface_module._get_grpc_client("ocr:8001")
+            second = model_interface_module._get_grpc_client("ocr:8001")
+            other = model_interface_module._get_grpc_client("other:8001")
+
+        self.assertIs(first, second)
+        self.assertEqual(other.endpoint, "other:8001")
+        self.assertEqual(mock_client_cls.call_count, 2)
+
+    def test_does_item_fit_in_batch(self):
+        """Test the padded-batch memory estimate against a budget."""
+        current_batch = [SimpleNamespace(dims=(10, 20)), SimpleNamespace(dims=(30, 5))]
+        next_request = SimpleNamespace(dims=(1, 1))
+        # 3 images padded to 30x20, 3 channels, 4 bytes per element
+        required_bytes = 3 * 30 * 20 * 3 * 4
+
+        self.assertTrue(self.model_interface.does_item_fit_in_batch(current_batch, next_request, required_bytes))
+        self.assertFalse(self.model_interface.does_item_fit_in_batch(current_batch, next_request, required_bytes - 1))
+
     def test_prepare_ocr_payload(self):
         """Test _prepare_ocr_payload method."""
         test_base64 = "test_base64_string"
@@ -518,6 +703,63 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
         self.assertEqual(texts[0], "Text 1")
         self.assertEqual(conf_scores[0], 0.9)
 
+    def test_postprocess_ocr_response_ragged_and_empty_boxes(self):
+        """Test _postprocess_ocr_response with polygons of differing point counts and with no boxes."""
+        bounding_boxes = [
+            [[0.1, 0.2], [0.3, 0.2], [0.3, 0.4], [0.1, 0.4]],
+            [[0.5, 0.6], [0.7, 0.6], [0.6, 0.8]],
+        ]
+        dims = [{"new_width": 100, "new_height": 200}]
+
+        bboxes, texts, scores = PaddleOCRModelInterface._postprocess_ocr_response(
+            bounding_boxes, ["Text 1", "Text 2"], [0.9, 0.8], dims, img_index=0
+        )
+
+        self.assertEqual([len(box) for box in bboxes], [4, 3])
+        self.assertAlmostEqual(bboxes[1][2][0], 60.0)
+        self.assertAlmostEqual(bboxes[1][2][1], 160.0)
+
+        bboxes, texts, scores = PaddleOCRModelInterface._postprocess_ocr_response(["nan"], ["Text"], [0.5], dims)
+        self.assertEqual((bboxes, texts, scores), ([], [], []))
+
+        # Empty polygons pass through unchanged, with or without the compiled kernel.
+        for kernel in (model_interface_module._transform_points_kernel, None):
+            with patch.object(model_interface_module, "_transform_points_kernel", kernel):
+                bboxes, _, _ = PaddleOCRModelInterface._postprocess_ocr_response([[]], ["Text"], [0.5], dims)
+                self.assertEqual(bboxes, [[]])
+
+                bboxes, _, _ = PaddleOCRModelInterface._postprocess_ocr_response(
+                    [[], [[0.1, 0.2], [0.3, 0.4]]], ["Text 1", "Text 2"], [0.9, 0.8], dims
+                )
+                self.assertEqual(bboxes[0], [])
+                self.assertAlmostEqual(bboxes[1][1][0], 30.0)
+                self.assertAlmostEqual(bboxes[1][1][1], 80.0)
+
+    def test_transform_points_kernel_matches_numpy(self):
+        """Test that the compiled transform, when available, matches the NumPy fallback."""
+        points = np.random.default_rng(0).random((5, 4, 2))
+        args = (1024, 768, 12, 8, 0.75)
+
+        with patch.object(model_interface_module, "_transform_points_kernel", None):
+            expected = model_interface_module._transform_points(points.copy(), *args)
+
+        np.testing.assert_allclose(expected[0, 0], (points[0, 0] * [1024, 768] - [12, 8]) / 0.75)
+        np.testing.assert_allclose(model_interface_module._transform_points(points.copy(), *args), expected)
+
+    def test_transform_points_concurrent_calls(self):
+        """Test that the transform can be called from many threads at once, as NimClient's batch pool does."""
+        points = np.random.default_rng(0).random((200, 4, 2))
+        args = (1024, 768, 12, 8, 0.75)
+        expected = (points * [1024, 768] - [12, 8]) / 0.75
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(
+                executor.map(lambda _: model_interface_module._transform_points(points.copy(), *args), range(64))
+            )
+
+        for result in results:
+            np.testing.assert_allclose(result, expected)
+
     def test_postprocess_ocr_response_no_dims(self):
         """Test _postprocess_ocr_response static method with no dims."""
         bounding_boxes = [[[0.1, 0.2], [0.3, 0.2], [0.3, 0.4], [0.1, 0.4]]]
@@ -553,5 +795,28 @@ class TestPaddleOCRModelInterface(unittest.TestCase):
             self.assertEqual(len(conf_scores), 1)
 
 
+class TestNemoRetrieverOCRModelInterface(unittest.TestCase):
+    def setUp(self):
+        self.model_interface = NemoRetrieverOCRModelInterface()
+
+    def test_format_input_grpc_merge_levels(self):
+        """Test that each gRPC batch gets one merge level per image."""
+        test_data = {
+            "base64_images": ["base64_image_1", "base64_image_2", "base64_image_3"],
+            "images": [np.zeros((100, 200, 3), dtype=np.uint8) for _ in range(3)],
+        }
+
+        batches, batch_data = self.model_interface.format_input(
+            test_data, protocol="grpc", max_batch_size=2, merge_level="word"
+        )
+
+        self.assertEqual(len(batches), 2)
+        self.assertEqual(batches[0][0].shape, (2, 1))
+        self.assertEqual(batches[0][1].tolist(), [["word"], ["word"]])
+        self.assertEqual(batches[1][1].tolist(), [["word"]])
+        self.assertEqual(batches[1][1].dtype, object)
+        self.assertEqual(test_data["image_dims"][2], {"new_width": 200, "new_height": 100})
+
+
 if __name__ == "__main__":
     unittest.main()
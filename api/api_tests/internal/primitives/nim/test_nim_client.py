@@ -2,16 +2,35 @@
 # All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import dataclasses
+import datetime
+import enum
+import json
 import unittest
+import uuid
 from unittest.mock import MagicMock, patch, call
 import numpy as np
 import requests
 
 from tritonclient.grpc import InferenceServerException
 
+import nv_ingest_api.internal.primitives.nim.nim_client as nim_client_module
 from nv_ingest_api.internal.primitives.nim.nim_client import NimClient
 
 
+class _PlainEnum(enum.Enum):
+    A = "a"
+
+
+class _IntEnum(enum.IntEnum):
+    A = 1
+
+
+@dataclasses.dataclass
+class _Payload:
+    value: int = 1
+
+
 class MockModelInterface:
     def name(self):
         return "mock_model"
@@ -59,6 +78,34 @@ class TestNimClientGrpc(unittest.TestCase):
         self.assertEqual(last_call_args[1]["outputs"][1].name(), "output2")
 
 
+class TestNimClientInfer(unittest.TestCase):
+    def setUp(self):
+        self.model_interface = MagicMock()
+        self.model_interface.prepare_data_for_inference.side_effect = lambda data: data
+        self.model_interface.parse_output.side_effect = lambda response, **kwargs: response
+        self.model_interface.process_inference_results.side_effect = lambda output, **kwargs: [output]
+        self.client = NimClient(self.model_interface, "grpc", ("localhost:8001", "http://localhost:8000"))
+        self.client._fetch_max_batch_size = MagicMock(return_value=2)
+        self.client._grpc_infer = MagicMock(side_effect=lambda batch, model_name, **kwargs: batch * 10)
+
+    @patch("nv_ingest_api.internal.primitives.nim.nim_client.ThreadPoolExecutor")
+    def test_infer_single_batch_runs_inline(self, mock_executor):
+        self.model_interface.format_input.return_value = ([1], [{}])
+
+        result = self.client.infer({}, "test_model")
+
+        self.assertEqual(result, [10])
+        mock_executor.assert_not_called()
+
+    def test_infer_multiple_batches_preserves_order(self):
+        self.model_interface.format_input.return_value = ([1, 2, 3], [{}, {}, {}])
+
+        result = self.client.infer({}, "test_model")
+
+        self.assertEqual(result, [10, 20, 30])
+        self.assertEqual(self.client._grpc_infer.call_count, 3)
+
+
 class TestNimClientGrpcRetry(unittest.TestCase):
     def setUp(self):
         self.model_interface = MockModelInterface()
@@ -282,6 +329,64 @@ class TestNimClientHttp(unittest.TestCase):
         self.assertEqual(mock_post.call_count, 3)  # max_retries is 3
         self.assertEqual(mock_sleep.call_count, 2)  # Sleeps before retries 2, 3
 
+    @patch("requests.post")
+    def test_http_infer_sends_serialized_json_body(self, mock_post):
+        mock_success_response = MagicMock()
+        mock_success_response.status_code = 200
+        mock_success_response.json.return_value = {"status": "success"}
+        mock_post.return_value = mock_success_response
+
+        payload = {"input": [{"type": "image_url", "url": "data:image/png;base64,abc"}], "scores": [1, 2.5]}
+
+        for orjson_module in (nim_client_module.orjson, None):
+            with patch.object(nim_client_module, "orjson", orjson_module):
+                self.client._http_infer(payload)
+
+            _, kwargs = mock_post.call_args
+            self.assertNotIn("json", kwargs)
+            self.assertEqual(json.loads(kwargs["data"]), payload)
+            self.assertEqual(kwargs["headers"]["content-type"], "application/json")
+
+    @patch("requests.post")
+    def test_http_infer_passes_preserialized_body_through(self, mock_post):
+        mock_success_response = MagicMock()
+        mock_success_response.status_code = 200
+        mock_success_response.json.return_value = {"status": "success"}
+        mock_post.return_value = mock_success_response
+
+        body = b'{"input": []}'
+        self.client._http_infer(body)
+
+        _, kwargs = mock_post.call_args
+        self.assertIs(kwargs["data"], body)
+
+    def test_serialize_http_payload_without_orjson(self):
+        with patch("nv_ingest_api.internal.primitives.nim.nim_client.orjson", None):
+            body = NimClient._serialize_http_payload({"input": ["a"], "n": 1})
+
+        self.assertEqual(json.loads(body), {"input": ["a"], "n": 1})
+
+    def test_serialize_http_payload_same_contract_with_and_without_orjson(self):
+        for orjson_module in (nim_client_module.orjson, None):
+            with patch.object(nim_client_module, "orjson", orjson_module):
+                with self.assertRaises(ValueError):
+                    NimClient._serialize_http_payload({"input": [{"score": float("nan")}]})
+                with self.assertRaises(ValueError):
+                    NimClient._serialize_http_payload({"input": [float("inf")]})
+                for value in (
+                    np.array([1, 2]),
+                    datetime.datetime(2024, 1, 1),
+                    _PlainEnum.A,
+                    uuid.UUID(int=0),
+                    _Payload(),
+                ):
+                    with self.assertRaises(TypeError):
+                        NimClient._serialize_http_payload({"input": [value]})
+
+                # Float subclasses and non-str keys are accepted, as the standard library accepts them.
+                body = NimClient._serialize_http_payload({"score": np.float64(0.5), 1: "a", "level": _IntEnum.A})
+                self.assertEqual(json.loads(body), {"score": 0.5, "1": "a", "level": 1})
+
 
 if __name__ == "__main__":
     unittest.main()
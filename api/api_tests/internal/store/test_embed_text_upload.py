@@ -177,3 +177,86 @@ def test_upload_text_embeddings_raises_wrapped_error(
 
     assert "upload_embeddings: Error uploading embeddings." in str(excinfo.value)
     assert "simulated error" in str(excinfo.value)
+
+
+@patch(f"{MODULE_UNDER_TEST}.RemoteBulkWriter")
+@patch(f"{MODULE_UNDER_TEST}.Collection")
+@patch(f"{MODULE_UNDER_TEST}.connections.connect")
+@patch(f"{MODULE_UNDER_TEST}.Minio")
+def test_upload_text_embeddings_skips_rows_without_embedding(
+    mock_minio, mock_connect, mock_collection, mock_bulk_writer, dummy_task_config
+):
+    text_metadata = {
+        "embedding": [0.4, 0.5],
+        "content": "text content",
+        "source_metadata": {"source_location": "text/location"},
+        "content_metadata": {"field": "text"},
+    }
+    no_embedding_metadata = {"embedding": None, "content": "skipped"}
+    df = pd.DataFrame(
+        [
+            {"metadata": no_embedding_metadata, "document_type": ContentTypeEnum.TEXT},
+            {"metadata": text_metadata, "document_type": ContentTypeEnum.TEXT},
+        ],
+        index=[10, 20],
+    )
+    mock_writer = mock_bulk_writer.return_value
+
+    result = module_under_test._upload_text_embeddings(df, dummy_task_config)
+
+    mock_writer.append_row.assert_called_once_with(
+        {
+            "text": "text content",
+            "source": {"source_location": "text/location"},
+            "content_metadata": {"field": "text"},
+            "vector": [0.4, 0.5],
+        }
+    )
+    assert result.loc[10, "metadata"] is no_embedding_metadata
+    assert result.loc[20, "metadata"]["embedding_metadata"] == {"uploaded_embedding_url": "embeddings"}
+    # The caller's metadata dicts are not mutated
+    assert "embedding_metadata" not in text_metadata
+
+
+@patch(f"{MODULE_UNDER_TEST}.RemoteBulkWriter")
+@patch(f"{MODULE_UNDER_TEST}.Collection")
+@patch(f"{MODULE_UNDER_TEST}.connections.connect")
+@patch(f"{MODULE_UNDER_TEST}.Minio")
+def test_upload_text_embeddings_passes_chunk_size_to_writer(
+    mock_minio, mock_connect, mock_collection, mock_bulk_writer, dummy_df, dummy_task_config
+):
+    df = pd.concat([dummy_df] * 5, ignore_index=True)
+    mock_writer = mock_bulk_writer.return_value
+
+    module_under_test._upload_text_embeddings(df, {**dummy_task_config, "chunk_size": 64 * 1024 * 1024})
+
+    assert mock_bulk_writer.call_args.kwargs["chunk_size"] == 64 * 1024 * 1024
+    assert mock_writer.append_row.call_count == 5
+    # The writer flushes full chunks itself; only the final commit is issued explicitly
+    mock_writer.commit.assert_called_once()
+
+
+@patch(f"{MODULE_UNDER_TEST}.RemoteBulkWriter")
+@patch(f"{MODULE_UNDER_TEST}.Collection")
+@patch(f"{MODULE_UNDER_TEST}.connections.connect")
+@patch(f"{MODULE_UNDER_TEST}.Minio")
+def test_upload_text_embeddings_uses_writer_default_chunk_size(
+    mock_minio, mock_connect, mock_collection, mock_bulk_writer, dummy_df, dummy_task_config
+):
+    module_under_test._upload_text_embeddings(dummy_df.copy(), dummy_task_config)
+
+    assert "chunk_size" not in mock_bulk_writer.call_args.kwargs
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5, True, "1024"])
+@patch(f"{MODULE_UNDER_TEST}.RemoteBulkWriter")
+@patch(f"{MODULE_UNDER_TEST}.Collection")
+@patch(f"{MODULE_UNDER_TEST}.connections.connect")
+@patch(f"{MODULE_UNDER_TEST}.Minio")
+def test_upload_text_embeddings_rejects_invalid_chunk_size(
+    mock_minio, mock_connect, mock_collection, mock_bulk_writer, chunk_size, dummy_df, dummy_task_config
+):
+    with pytest.raises(ValueError) as excinfo:
+        module_under_test._upload_text_embeddings(dummy_df.copy(), {**dummy_task_config, "chunk_size": chunk_size})
+
+    assert "chunk_size must be a positive integer" in str(excinfo.value)
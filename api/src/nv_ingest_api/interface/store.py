@@ -30,6 +30,7 @@ def store_embeddings(
     minio_bucket_path: Optional[str] = None,
     minio_secure: Optional[bool] = None,
     minio_region: Optional[str] = None,
+    chunk_size: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Stores embeddings by configuring task parameters and invoking the internal storage routine.
@@ -67,6 +68,8 @@ def store_embeddings(
         Whether to use a secure connection to MinIO.
     minio_region : Optional[str], default=None
         The region of the MinIO service.
+    chunk_size : Optional[int], default=None
+        The buffer size in bytes at which the bulk writer flushes embeddings to a file in MinIO.
 
     Returns
     -------
@@ -79,6 +82,7 @@ def store_embeddings(
         Propagates any exception raised during the storage process, wrapped with additional context.
     """
     params: Dict[str, Any] = {
+        "chunk_size": chunk_size,
         "milvus_address": milvus_address,
         "milvus_collection_name": milvus_collection_name,
         "milvus_host": milvus_host,
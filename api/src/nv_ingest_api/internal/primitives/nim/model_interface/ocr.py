@@ -5,11 +5,16 @@
 import json
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
+from typing import Union
 
 import backoff
 import numpy as np
@@ -20,14 +25,131 @@ from nv_ingest_api.internal.primitives.nim.model_interface.decorators import mul
 from nv_ingest_api.internal.primitives.nim.model_interface.helpers import preprocess_image_for_paddle
 from nv_ingest_api.util.image_processing.transforms import base64_to_numpy
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 DEFAULT_OCR_MODEL_NAME = "scene_text_ensemble"
 NEMORETRIEVER_OCR_MODEL_NAME = "scene_text_wrapper"
 NEMORETRIEVER_OCR_ENSEMBLE_MODEL_NAME = "scene_text_ensemble"
 NEMORETRIEVER_OCR_BLS_MODEL_NAME = "scene_text_python"
 
+PNG_DATA_URL_PREFIX = "data:image/png;base64,"
+
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for per-image decoding and preprocessing. OpenCV and NumPy release the GIL for
+# the heavy work, so processing a batch of images concurrently scales with the available cores.
+# Size it from the CPUs this process may run on, which can be far fewer than the host's in a container.
+_IMAGE_POOL = ThreadPoolExecutor(
+    max_workers=len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+    thread_name_prefix="ocr_image",
+)
+
+# Triton clients reused across model-name lookups so backoff retries do not set up a new channel each time.
+_CLIENTS: Dict[str, grpcclient.InferenceServerClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _imap_images(func: Callable[[Any], Any], items: List[Any]) -> Iterator[Any]:
+    """
+    Lazily apply `func` to each item on the shared image pool, yielding results in input order.
+
+    Single items are processed inline to avoid the executor round trip. As with a plain loop,
+    the first exception (in input order) is re-raised. The pool drops its reference to each
+    result once it is yielded, so a consumer that does not keep results holds at most the
+    ones still pending.
+    """
+    if len(items) <= 1:
+        yield from (func(item) for item in items)
+        return
+
+    yield from _IMAGE_POOL.map(func, items)
+
+
+def _map_images(func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    """
+    Apply `func` to each item on the shared image pool, preserving input order.
+    """
+    return list(_imap_images(func, items))
+
+
+if numba is not None:
+
+    # Serial on purpose: the kernel is called from NimClient's batch threads, and numba's parallel
+    # (workqueue) threading layer aborts the process on concurrent use. The loop is auto-vectorized.
+    # Not cached to disk: with a read-only install, cache=True fails at decoration, i.e. on import.
+    @numba.njit
+    def _transform_points_kernel(flat_points, max_width, max_height, pad_width, pad_height, scale_factor):
+        for i in range(flat_points.shape[0]):
+            flat_points[i, 0] = (flat_points[i, 0] * max_width - pad_width) / scale_factor
+            flat_points[i, 1] = (flat_points[i, 1] * max_height - pad_height) / scale_factor
+
+else:
+    _transform_points_kernel = None
+
+
+def _transform_points(
+    points: np.ndarray,
+    max_width: float,
+    max_height: float,
+    pad_width: float,
+    pad_height: float,
+    scale_factor: float,
+) -> np.ndarray:
+    """
+    Convert normalized (x, y) points of shape (..., 2) back to pixel coordinates in place,
+    shifting them back to their original positions if the image was padded and rescaled.
+
+    Contiguous float64 inputs go through a compiled Numba kernel when numba is installed;
+    otherwise the transform runs as vectorized NumPy. Empty input (e.g. a polygon with no
+    points) is returned unchanged.
+    """
+    if points.size == 0:
+        return points
+
+    if _transform_points_kernel is not None and points.dtype == np.float64 and points.flags.c_contiguous:
+        # Cast the scalars so the kernel is compiled for a single signature.
+        _transform_points_kernel(
+            points.reshape(-1, 2),
+            float(max_width),
+            float(max_height),
+            float(pad_width),
+            float(pad_height),
+            float(scale_factor),
+        )
+        return points
+
+    points[..., 0] = (points[..., 0] * max_width - pad_width) / scale_factor
+    points[..., 1] = (points[..., 1] * max_height - pad_height) / scale_factor
+    return points
+
+
+def _is_nested_singleton(value: Any) -> bool:
+    """
+    Check whether `value` is a single-item list that wraps another list, e.g. [[...]].
+    """
+    return isinstance(value, list) and len(value) == 1 and isinstance(value[0], list)
+
+
+def _loads_json_bytes(bytestr: bytes) -> Any:
+    """
+    Parse a UTF-8 encoded JSON byte string without decoding it to `str` first.
+
+    Uses orjson when it is installed and falls back to the standard library otherwise.
+    """
+    if orjson is not None:
+        # memoryview is zero-copy and also covers numpy.bytes_ elements, which orjson rejects.
+        return orjson.loads(memoryview(bytestr))
+    return json.loads(bytestr)
+
 
 class OCRModelInterfaceBase(ModelInterface):
 
@@ -119,6 +241,46 @@ class OCRModelInterfaceBase(ModelInterface):
 
         return potential_memory_bytes <= memory_budget_bytes
 
+    @staticmethod
+    def _has_decoded_images(data: Dict[str, Any]) -> bool:
+        """
+        Check whether `data` already carries decoded images, so decoding can be skipped.
+
+        Parameters
+        ----------
+        data : dict of str -> Any
+            The input data dictionary.
+
+        Returns
+        -------
+        bool
+            True if data["images"] is a non-empty list of NumPy arrays.
+        """
+        images = data.get("images")
+        return isinstance(images, list) and bool(images) and all(isinstance(img, np.ndarray) for img in images)
+
+    @staticmethod
+    def _decode_base64_images(base64_list: List[str]) -> List[np.ndarray]:
+        """
+        Decode a list of base64-encoded images into NumPy arrays using the shared image pool.
+
+        Parameters
+        ----------
+        base64_list : list of str
+            The base64-encoded images to decode.
+
+        Returns
+        -------
+        list of np.ndarray
+            The decoded images, in the same order as `base64_list`.
+
+        Raises
+        ------
+        ValueError
+            If any image cannot be decoded. The first failure in input order is re-raised.
+        """
+        return _map_images(base64_to_numpy, base64_list)
+
     def _prepare_ocr_payload(self, base64_img: str) -> Dict[str, Any]:
         """
         DEPRECATED by batch logic in format_input. Kept here if you need single-image direct calls.
@@ -133,9 +295,7 @@ class OCRModelInterfaceBase(ModelInterface):
         dict of str -> Any
             The payload in either legacy or new format for OCR's HTTP endpoint.
         """
-        image_url = f"data:image/png;base64,{base64_img}"
-
-        image = {"type": "image_url", "url": image_url}
+        image = {"type": "image_url", "url": PNG_DATA_URL_PREFIX + base64_img}
         payload = {"input": [image]}
 
         return payload
@@ -175,13 +335,9 @@ class OCRModelInterfaceBase(ModelInterface):
         results: List[str] = []
         for item_idx, item in enumerate(json_response["data"]):
             text_detections = item.get("text_detections", [])
-            text_predictions = []
-            bounding_boxes = []
-            conf_scores = []
-            for td in text_detections:
-                text_predictions.append(td["text_prediction"]["text"])
-                bounding_boxes.append([[pt["x"], pt["y"]] for pt in td["bounding_box"]["points"]])
-                conf_scores.append(td["text_prediction"]["confidence"])
+            text_predictions = [td["text_prediction"]["text"] for td in text_detections]
+            conf_scores = [td["text_prediction"]["confidence"] for td in text_detections]
+            bounding_boxes = self._stack_http_bounding_boxes(text_detections)
 
             bounding_boxes, text_predictions, conf_scores = self._postprocess_ocr_response(
                 bounding_boxes,
@@ -195,6 +351,26 @@ class OCRModelInterfaceBase(ModelInterface):
 
         return results
 
+    @staticmethod
+    def _stack_http_bounding_boxes(text_detections: List[Dict[str, Any]]) -> Union[np.ndarray, List[Any]]:
+        """
+        Collect the bounding-box points of HTTP text detections into a single (N, P, 2) float64 array.
+
+        Falls back to a list of [[x, y], ...] boxes when there are no detections or when the
+        polygons do not all have the same number of points.
+        """
+        points_per_box = {len(td["bounding_box"]["points"]) for td in text_detections}
+        if len(points_per_box) != 1:
+            return [[[pt["x"], pt["y"]] for pt in td["bounding_box"]["points"]] for td in text_detections]
+
+        num_points = points_per_box.pop()
+        coords = np.fromiter(
+            (coord for td in text_detections for pt in td["bounding_box"]["points"] for coord in (pt["x"], pt["y"])),
+            dtype=np.float64,
+            count=len(text_detections) * num_points * 2,
+        )
+        return coords.reshape(len(text_detections), num_points, 2)
+
     def _extract_content_from_ocr_grpc_response(
         self,
         response: np.ndarray,
@@ -252,25 +428,21 @@ class OCRModelInterfaceBase(ModelInterface):
         for i in range(batch_size):
             # 1) Parse bounding boxes
             bboxes_bytestr: bytes = response[0, i]
-            bounding_boxes = json.loads(bboxes_bytestr.decode("utf8"))
+            bounding_boxes = _loads_json_bytes(bboxes_bytestr)
 
             # 2) Parse text predictions
             texts_bytestr: bytes = response[1, i]
-            text_predictions = json.loads(texts_bytestr.decode("utf8"))
+            text_predictions = _loads_json_bytes(texts_bytestr)
 
             # 3) Parse confidence scores
             confs_bytestr: bytes = response[2, i]
-            conf_scores = json.loads(confs_bytestr.decode("utf8"))
+            conf_scores = _loads_json_bytes(confs_bytestr)
 
-            # Some gRPC responses nest single-item lists; flatten them if needed
+            # Some gRPC responses nest single-item lists; flatten them if all three outputs are nested
             if (
-                (isinstance(bounding_boxes, list) and len(bounding_boxes) == 1 and isinstance(bounding_boxes[0], list))
-                and (
-                    isinstance(text_predictions, list)
-                    and len(text_predictions) == 1
-                    and isinstance(text_predictions[0], list)
-                )
-                and (isinstance(conf_scores, list) and len(conf_scores) == 1 and isinstance(conf_scores[0], list))
+                _is_nested_singleton(bounding_boxes)
+                and _is_nested_singleton(text_predictions)
+                and _is_nested_singleton(conf_scores)
             ):
                 bounding_boxes = bounding_boxes[0]
                 text_predictions = text_predictions[0]
@@ -307,8 +479,9 @@ class OCRModelInterfaceBase(ModelInterface):
 
         Parameters
         ----------
-        bounding_boxes : list of Any
-            A list (per line of text) of bounding boxes, each a list of (x, y) points.
+        bounding_boxes : list of Any or np.ndarray
+            A list (per line of text) of bounding boxes, each a list of (x, y) points, or an
+            already stacked array of shape (N, P, 2).
         text_predictions : list of str
             A list of text predictions, one for each bounding box.
         img_index : int, optional
@@ -345,27 +518,39 @@ class OCRModelInterfaceBase(ModelInterface):
         pad_height = dims[img_index].get("pad_height", 0) if shift_coordinates else 0.0
         scale_factor = dims[img_index].get("scale_factor", 1.0) if scale_coordinates else 1.0
 
-        bboxes: List[List[float]] = []
+        transform_args = (max_width, max_height, pad_width, pad_height, scale_factor)
+
+        if isinstance(bounding_boxes, np.ndarray):
+            # Pre-stacked (N, P, 2) boxes have no "nan" placeholders; transform a copy in one pass.
+            count = min(len(bounding_boxes), len(text_predictions), len(conf_scores))
+            points = np.array(bounding_boxes[:count], dtype=np.float64)
+            bboxes = _transform_points(points, *transform_args).tolist()
+            return bboxes, list(text_predictions[:count]), list(conf_scores[:count])
+
+        boxes: List[Any] = []
         texts: List[str] = []
         confs: List[float] = []
 
-        # Convert normalized coords back to actual pixel coords
         for box, txt, conf in zip(bounding_boxes, text_predictions, conf_scores):
-            if box == "nan":
+            if isinstance(box, str) and box == "nan":
                 continue
-            points: List[List[float]] = []
-            for point in box:
-                # Convert normalized coords back to actual pixel coords,
-                # and shift them back to their original positions if padded.
-                x_pixels = float(point[0]) * max_width - pad_width
-                y_pixels = float(point[1]) * max_height - pad_height
-                x_original = x_pixels / scale_factor
-                y_original = y_pixels / scale_factor
-                points.append([x_original, y_original])
-            bboxes.append(points)
+            boxes.append(box)
             texts.append(txt)
             confs.append(conf)
 
+        if not boxes:
+            return [], texts, confs
+
+        try:
+            points = np.asarray(boxes, dtype=np.float64)
+        except ValueError:
+            # Polygons with differing point counts cannot be stacked; transform each box on its own.
+            bboxes = [_transform_points(np.asarray(box, dtype=np.float64), *transform_args).tolist() for box in boxes]
+            return bboxes, texts, confs
+
+        # Convert normalized coords back to actual pixel coords for all boxes at once.
+        bboxes = _transform_points(points, *transform_args).tolist()
+
         return bboxes, texts, confs
 
 
@@ -402,7 +587,7 @@ class PaddleOCRModelInterface(OCRModelInterfaceBase):
         dict of str -> Any
             The updated data dictionary with the following keys added:
             - "images": List of decoded NumPy arrays of shape (H, W, C).
-            - "image_dims": List of (height, width) tuples for each decoded image.
+            - "image_dims": List of {"new_width", "new_height"} dicts for each decoded image.
 
         Raises
         ------
@@ -410,26 +595,30 @@ class PaddleOCRModelInterface(OCRModelInterfaceBase):
             If neither 'base64_image' nor 'base64_images' is found in `data`.
         ValueError
             If 'base64_images' is present but is not a list.
+
+        Notes
+        -----
+        If `data` already holds decoded images under "images", decoding is skipped.
         """
-        if "base64_images" in data:
-            base64_list = data["base64_images"]
-            if not isinstance(base64_list, list):
-                raise ValueError("The 'base64_images' key must contain a list of base64-encoded strings.")
+        if not self._has_decoded_images(data):
+            if "base64_images" in data:
+                base64_list = data["base64_images"]
+                if not isinstance(base64_list, list):
+                    raise ValueError("The 'base64_images' key must contain a list of base64-encoded strings.")
 
-            images: List[np.ndarray] = []
-            for b64 in base64_list:
-                img = base64_to_numpy(b64)
-                images.append(img)
+                data["images"] = self._decode_base64_images(base64_list)
 
-            data["images"] = images
+            elif "base64_image" in data:
+                # Single-image fallback
+                img = base64_to_numpy(data["base64_image"])
+                data["images"] = [img]
 
-        elif "base64_image" in data:
-            # Single-image fallback
-            img = base64_to_numpy(data["base64_image"])
-            data["images"] = [img]
+            else:
+                raise KeyError("Input data must include 'base64_image' or 'base64_images'.")
 
-        else:
-            raise KeyError("Input data must include 'base64_image' or 'base64_images'.")
+        # Record the original dims while the decoded images are at hand, so the HTTP branch of
+        # format_input only has to handle base64 strings.
+        data["image_dims"] = [{"new_width": img.shape[1], "new_height": img.shape[0]} for img in data["images"]]
 
         return data
 
@@ -440,8 +629,9 @@ class PaddleOCRModelInterface(OCRModelInterfaceBase):
         Parameters
         ----------
         data : dict of str -> Any
-            The input data dictionary, expected to contain "images" (list of np.ndarray)
-            and "image_dims" (list of (height, width) tuples), as produced by prepare_data_for_inference.
+            The input data dictionary, expected to contain "images" (list of np.ndarray) and "image_dims"
+            as produced by prepare_data_for_inference. For gRPC, "image_dims" is replaced with the
+            per-image preprocessing metadata.
         protocol : str
             The inference protocol, either "grpc" or "http".
         max_batch_size : int
@@ -458,47 +648,36 @@ class PaddleOCRModelInterface(OCRModelInterfaceBase):
         Raises
         ------
         KeyError
-            If either "images" or "image_dims" is not found in `data`.
+            If "images" is not found in `data`.
         ValueError
             If an invalid protocol is specified.
         """
 
-        images = data["images"]
-
-        dims: List[Dict[str, Any]] = []
-        data["image_dims"] = dims
-
-        # Helper function to split a list into chunks of size up to chunk_size.
-        def chunk_list(lst, chunk_size):
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
-
-        if "images" not in data or "image_dims" not in data:
-            raise KeyError("Expected 'images' and 'image_dims' in data. Call prepare_data_for_inference first.")
+        if "images" not in data:
+            raise KeyError("Expected 'images' in data. Call prepare_data_for_inference first.")
 
         images = data["images"]
-        dims = data["image_dims"]
 
         if protocol == "grpc":
             logger.debug("Formatting input for gRPC OCR model (batched).")
-            processed: List[np.ndarray] = []
-
-            for img in images:
-                arr, _dims = preprocess_image_for_paddle(img)
-                dims.append(_dims)
-                arr = arr.astype(np.float32)
-                arr = np.expand_dims(arr, axis=0)
-                processed.append(arr)
+            dims: List[Dict[str, Any]] = []
+            data["image_dims"] = dims
 
             batches = []
             batch_data_list = []
-            for proc_chunk, orig_chunk, dims_chunk in zip(
-                chunk_list(processed, max_batch_size),
-                chunk_list(images, max_batch_size),
-                chunk_list(dims, max_batch_size),
-            ):
-                batched_input = np.concatenate(proc_chunk, axis=0)
+            for start in range(0, len(images), max_batch_size):
+                end = start + max_batch_size
+                orig_chunk = images[start:end]
+                batched_input = None
+                # Copy each preprocessed (C, H, W) image into its batch buffer as soon as it is ready and
+                # drop it, so only the (B, C, H, W) buffers outlive preprocessing.
+                for i, (arr, _dims) in enumerate(_imap_images(preprocess_image_for_paddle, orig_chunk)):
+                    if batched_input is None:
+                        batched_input = np.empty((len(orig_chunk), *arr.shape), dtype=np.float32)
+                    batched_input[i] = arr
+                    dims.append(_dims)
                 batches.append(batched_input)
-                batch_data_list.append({"images": orig_chunk, "image_dims": dims_chunk})
+                batch_data_list.append({"images": orig_chunk, "image_dims": dims[start:end]})
             return batches, batch_data_list
 
         elif protocol == "http":
@@ -508,24 +687,21 @@ class PaddleOCRModelInterface(OCRModelInterfaceBase):
             else:
                 base64_list = [data["base64_image"]]
 
-            input_list: List[Dict[str, Any]] = []
-            for b64, img in zip(base64_list, images):
-                image_url = f"data:image/png;base64,{b64}"
-                image_obj = {"type": "image_url", "url": image_url}
-                input_list.append(image_obj)
-                _dims = {"new_width": img.shape[1], "new_height": img.shape[0]}
-                dims.append(_dims)
+            dims = data.get("image_dims")
+            if not dims or len(dims) != len(images):
+                # Only reached when prepare_data_for_inference did not record the dims.
+                dims = [{"new_width": img.shape[1], "new_height": img.shape[0]} for img in images]
+                data["image_dims"] = dims
+
+            input_list = [{"type": "image_url", "url": PNG_DATA_URL_PREFIX + b64} for b64 in base64_list]
 
             batches = []
             batch_data_list = []
-            for input_chunk, orig_chunk, dims_chunk in zip(
-                chunk_list(input_list, max_batch_size),
-                chunk_list(images, max_batch_size),
-                chunk_list(dims, max_batch_size),
-            ):
-                payload = {"input": input_chunk}
+            for start in range(0, len(input_list), max_batch_size):
+                end = start + max_batch_size
+                payload = {"input": input_list[start:end]}
                 batches.append(payload)
-                batch_data_list.append({"images": orig_chunk, "image_dims": dims_chunk})
+                batch_data_list.append({"images": images[start:end], "image_dims": dims[start:end]})
 
             return batches, batch_data_list
 
@@ -574,18 +750,20 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
             If neither 'base64_image' nor 'base64_images' is found in `data`.
         ValueError
             If 'base64_images' is present but is not a list.
+
+        Notes
+        -----
+        If `data` already holds decoded images under "images", it is returned unchanged.
         """
+        if self._has_decoded_images(data):
+            return data
+
         if "base64_images" in data:
             base64_list = data["base64_images"]
             if not isinstance(base64_list, list):
                 raise ValueError("The 'base64_images' key must contain a list of base64-encoded strings.")
 
-            images: List[np.ndarray] = []
-            for b64 in base64_list:
-                img = base64_to_numpy(b64)
-                images.append(img)
-
-            data["images"] = images
+            data["images"] = self._decode_base64_images(base64_list)
 
         elif "base64_image" in data:
             # Single-image fallback
@@ -662,10 +840,6 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
             If an invalid protocol is specified.
         """
 
-        # Helper function to split a list into chunks of size up to chunk_size.
-        def chunk_list(lst, chunk_size):
-            return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
-
         if "images" not in data:
             raise KeyError("Expected 'images' in data. Call prepare_data_for_inference first.")
 
@@ -675,10 +849,17 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
         formatted_batches = []
         formatted_batch_data = []
 
-        image_chunks = chunk_list(images, max_batch_size)
-        dims_chunks = chunk_list(dims, max_batch_size)
-        for image_chunk, dims_chunk in zip(image_chunks, dims_chunks):
-            final_batch, batch_data = self._format_single_batch(image_chunk, dims_chunk, protocol, **kwargs)
+        # The merge level is the same for every image, so build its gRPC input once and hand each
+        # batch a view of it.
+        merge_levels = None
+        if protocol == "grpc":
+            merge_levels = np.full((len(images), 1), kwargs.get("merge_level", "paragraph"), dtype=object)
+
+        for start in range(0, len(images), max_batch_size):
+            end = start + max_batch_size
+            if merge_levels is not None:
+                kwargs["merge_levels"] = merge_levels[start:end]
+            final_batch, batch_data = self._format_single_batch(images[start:end], dims[start:end], protocol, **kwargs)
             formatted_batches.append(final_batch)
             formatted_batch_data.append(batch_data)
 
@@ -712,10 +893,9 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
 
             batched_input = np.concatenate(processed, axis=0)
 
-            batch_size = batched_input.shape[0]
-
-            merge_levels_list = [[merge_level] for _ in range(batch_size)]
-            merge_levels = np.array(merge_levels_list, dtype="object")
+            merge_levels = kwargs.get("merge_levels")
+            if merge_levels is None:
+                merge_levels = np.full((batched_input.shape[0], 1), merge_level, dtype=object)
 
             final_batch = [batched_input, merge_levels]
             batch_data = {"image_dims": dims}
@@ -727,9 +907,7 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
 
             input_list: List[Dict[str, Any]] = []
             for b64, shape in zip(batch_images, batch_dims):
-                image_url = f"data:image/png;base64,{b64}"
-                image_obj = {"type": "image_url", "url": image_url}
-                input_list.append(image_obj)
+                input_list.append({"type": "image_url", "url": PNG_DATA_URL_PREFIX + b64})
                 _dims = {"new_width": shape[1], "new_height": shape[0]}
                 dims.append(_dims)
 
@@ -746,6 +924,18 @@ class NemoRetrieverOCRModelInterface(OCRModelInterfaceBase):
             raise ValueError("Invalid protocol specified. Must be 'grpc' or 'http'.")
 
 
+def _get_grpc_client(grpc_endpoint: str) -> grpcclient.InferenceServerClient:
+    """
+    Return the shared Triton gRPC client for `grpc_endpoint`, creating it on first use.
+    """
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(grpc_endpoint)
+        if client is None:
+            client = grpcclient.InferenceServerClient(grpc_endpoint)
+            _CLIENTS[grpc_endpoint] = client
+        return client
+
+
 @multiprocessing_cache(max_calls=100)  # Cache results first to avoid redundant retries from backoff
 @backoff.on_predicate(backoff.expo, max_time=30)
 def get_ocr_model_name(ocr_grpc_endpoint=None, default_model_name=DEFAULT_OCR_MODEL_NAME):
@@ -765,7 +955,7 @@ def get_ocr_model_name(ocr_grpc_endpoint=None, default_model_name=DEFAULT_OCR_MO
 
     # 3. Attempt to query the gRPC endpoint to discover the model name.
     try:
-        client = grpcclient.InferenceServerClient(ocr_grpc_endpoint)
+        client = _get_grpc_client(ocr_grpc_endpoint)
         model_index = client.get_model_repository_index(as_json=True)
         model_names = [x["name"] for x in model_index.get("models", [])]
         ocr_model_name = model_names[0]
@@ -5,12 +5,15 @@
 import hashlib
 import json
 import logging
+import math
 import re
 import threading
 import time
 import queue
+import uuid
 from collections import namedtuple
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from enum import Enum
 from typing import Any
 from typing import Optional
 from typing import Tuple, Union
@@ -22,6 +25,11 @@ import tritonclient.grpc as grpcclient
 from nv_ingest_api.internal.primitives.tracing.tagging import traceable_func
 from nv_ingest_api.util.string_processing import generate_url
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +43,27 @@ CUDA_ERROR_REGEX = re.compile(
 InferenceRequest = namedtuple("InferenceRequest", ["data", "future", "model_name", "dims", "kwargs"])
 
 
+def _requires_stdlib_json(obj: Any) -> bool:
+    """
+    Return True if a JSON-like payload holds values that orjson would encode differently from the
+    standard library: non-finite floats (written as null), Enum members and UUIDs (always encoded).
+    """
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, (Enum, uuid.UUID)):
+            return True
+        elif isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
 class NimClient:
     """
     A client for interfacing with a model inference server using gRPC or HTTP protocols.
@@ -258,20 +287,27 @@ class NimClient:
             # Check for a custom maximum pool worker count, and remove it from kwargs.
             max_pool_workers = kwargs.pop("max_pool_workers", 16)
 
-            # 4. Process each batch concurrently using a thread pool.
-            #    We enumerate the batches so that we can later reassemble results in order.
+            # 4. Process each batch concurrently using a thread pool, keeping one request in flight per
+            #    batch so their round trips overlap. We enumerate the batches so that we can later
+            #    reassemble results in order. A single batch is run inline, as a pool would not help.
             results = [None] * len(formatted_batches)
-            with ThreadPoolExecutor(max_workers=max_pool_workers) as executor:
-                future_to_idx = {}
-                for idx, (batch, batch_data) in enumerate(zip(formatted_batches, formatted_batch_data)):
-                    future = executor.submit(
-                        self._process_batch, batch, batch_data=batch_data, model_name=model_name, **kwargs
-                    )
-                    future_to_idx[future] = idx
+            if len(formatted_batches) == 1:
+                results[0] = self._process_batch(
+                    formatted_batches[0], batch_data=formatted_batch_data[0], model_name=model_name, **kwargs
+                )
+            elif formatted_batches:
+                pool_workers = min(max_pool_workers, len(formatted_batches))
+                with ThreadPoolExecutor(max_workers=pool_workers) as executor:
+                    future_to_idx = {}
+                    for idx, (batch, batch_data) in enumerate(zip(formatted_batches, formatted_batch_data)):
+                        future = executor.submit(
+                            self._process_batch, batch, batch_data=batch_data, model_name=model_name, **kwargs
+                        )
+                        future_to_idx[future] = idx
 
-                for future in as_completed(future_to_idx.keys()):
-                    idx = future_to_idx[future]
-                    results[idx] = future.result()
+                    for future in as_completed(future_to_idx.keys()):
+                        idx = future_to_idx[future]
+                        results[idx] = future.result()
 
             # 5. Process the parsed outputs for each batch using its corresponding batch_data.
             #    As the batches are in order, we coalesce their outputs accordingly.
@@ -426,14 +462,14 @@ class NimClient:
                 logger.error(f"An unexpected error occurred during gRPC inference for model '{model_name}': {e}")
                 raise
 
-    def _http_infer(self, formatted_input: dict) -> dict:
+    def _http_infer(self, formatted_input: Union[dict, bytes]) -> dict:
         """
         Perform inference using the HTTP protocol, retrying for timeouts or 5xx errors up to 5 times.
 
         Parameters
         ----------
-        formatted_input : dict
-            The input data formatted as a dictionary.
+        formatted_input : dict or bytes
+            The input data formatted as a dictionary, or an already serialized JSON request body.
 
         Returns
         -------
@@ -448,6 +484,8 @@ class NimClient:
             For other HTTP-related errors that persist after max retries.
         """
 
+        body = self._serialize_http_payload(formatted_input)
+
         base_delay = 2.0
         attempt = 0
         retries_429 = 0
@@ -462,9 +500,7 @@ class NimClient:
                         model_name = self.model_interface.name()
                         logger.debug(f"{model_name}: Sending HTTP request with system prompt: '{system_content}'")
 
-                response = requests.post(
-                    self.endpoint_url, json=formatted_input, headers=self.headers, timeout=self.timeout
-                )
+                response = requests.post(self.endpoint_url, data=body, headers=self.headers, timeout=self.timeout)
                 status_code = response.status_code
 
                 # Check for server-side or rate-limit type errors
@@ -539,6 +575,33 @@ class NimClient:
         logger.error(f"Failed to get a successful response after {self.max_retries} retries.")
         raise Exception(f"Failed to get a successful response after {self.max_retries} retries.")
 
+    @staticmethod
+    def _serialize_http_payload(formatted_input: Union[dict, bytes]) -> bytes:
+        """
+        Serialize an HTTP request payload to a JSON body once, so retries reuse the same bytes.
+
+        Pre-serialized bodies are passed through unchanged. Otherwise orjson is used when it is installed,
+        which is considerably faster than the standard library on large base64 image payloads. Any payload
+        orjson would encode differently (non-finite floats, Enum members, UUIDs) or cannot encode under
+        the standard library's rules (NumPy values, datetimes, dataclasses, non-str keys) is handed to
+        the standard library, so it is accepted or rejected as `requests` does for `json=`.
+        """
+        if isinstance(formatted_input, (bytes, bytearray)):
+            return formatted_input
+
+        if orjson is not None and not _requires_stdlib_json(formatted_input):
+            try:
+                # Datetimes and dataclasses must raise here rather than be encoded natively.
+                return orjson.dumps(
+                    formatted_input, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+                )
+            except orjson.JSONEncodeError:
+                # e.g. float subclasses or non-str keys, which the standard library may still encode.
+                pass
+
+        # Match the encoding `requests` applies for `json=` payloads.
+        return json.dumps(formatted_input, allow_nan=False).encode("utf-8")
+
     def _batcher_loop(self):
         """The main loop for the background thread to form and process batches."""
         while not self._stop_event.is_set():
@@ -73,6 +73,9 @@ def _upload_text_embeddings(df_store_ledger: pd.DataFrame, task_config: Dict[str
                 Port for Milvus.
           - "collection_name": str, default "nv_ingest_collection"
                 Name of the Milvus collection from which to retrieve the schema.
+          - "chunk_size": Optional[int]
+                (Optional) Size in bytes at which the writer flushes its buffer to a file in MinIO.
+                Defaults to the RemoteBulkWriter default.
 
     Returns
     -------
@@ -100,6 +103,12 @@ def _upload_text_embeddings(df_store_ledger: pd.DataFrame, task_config: Dict[str
         milvus_port: int = task_config.get("milvus_port", 19530)
         milvus_collection_name: str = task_config.get("collection_name", "nv_ingest_collection")
 
+        chunk_size: Optional[int] = task_config.get("chunk_size")
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1
+        ):
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size!r}.")
+
         # Initialize MinIO client
         client = Minio(
             minio_endpoint,
@@ -134,37 +143,47 @@ def _upload_text_embeddings(df_store_ledger: pd.DataFrame, task_config: Dict[str
             bucket_name=minio_bucket_name,
             secure=False,
         )
+        # The writer flushes its buffer on its own whenever it exceeds chunk_size.
+        writer_kwargs: Dict[str, Any] = {} if chunk_size is None else {"chunk_size": chunk_size}
         writer = RemoteBulkWriter(
             schema=schema,
             remote_path=minio_bucket_path,
             connect_param=conn,
             file_type=BulkFileType.PARQUET,
+            **writer_kwargs,
         )
 
-        # Process each row in the DataFrame
-        for idx, row in df_store_ledger.iterrows():
-            metadata: Dict[str, Any] = row["metadata"].copy()
+        # Pull the columns out once; iterating plain lists avoids building a Series per row.
+        metadata_list = df_store_ledger["metadata"].to_list()
+        doc_types = df_store_ledger["document_type"].to_list()
+
+        for idx, (row_metadata, doc_type) in enumerate(zip(metadata_list, doc_types)):
+            # Only rows with an embedding are uploaded and have their metadata updated
+            if row_metadata.get("embedding") is None:
+                continue
+
+            metadata: Dict[str, Any] = row_metadata.copy()
             # Update embedding metadata with the bucket path
             metadata["embedding_metadata"] = {"uploaded_embedding_url": minio_bucket_path}
 
-            doc_type = row["document_type"]
             content_replace: bool = doc_type in [ContentTypeEnum.IMAGE, ContentTypeEnum.STRUCTURED]
             location: str = metadata["source_metadata"]["source_location"]
             content = metadata["content"]
 
-            # If an embedding exists, update metadata and append the row for upload
-            if metadata.get("embedding") is not None:
-                logger.error(f"row type: {doc_type} -  {location} -  {len(content)}")
-                df_store_ledger.at[idx, "metadata"] = metadata
-
-                writer.append_row(
-                    {
-                        "text": location if content_replace else content,
-                        "source": metadata["source_metadata"],
-                        "content_metadata": metadata["content_metadata"],
-                        "vector": metadata["embedding"],
-                    }
-                )
+            logger.debug("row type: %s - %s - %d", doc_type, location, len(content))
+            metadata_list[idx] = metadata
+
+            writer.append_row(
+                {
+                    "text": location if content_replace else content,
+                    "source": metadata["source_metadata"],
+                    "content_metadata": metadata["content_metadata"],
+                    "vector": metadata["embedding"],
+                }
+            )
+
+        # Write the updated metadata back with a single column assignment
+        df_store_ledger["metadata"] = metadata_list
 
         writer.commit()
         return df_store_ledger
@@ -452,7 +452,11 @@ def normalize_image(
 
     mean = np.array([r_mean, g_mean, b_mean]).reshape((1, 1, 3)).astype(np.float32)
     std = np.array([r_std, g_std, b_std]).reshape((1, 1, 3)).astype(np.float32)
-    output_array = (array.astype("float32") / 255.0 - mean) / std
+    # Cast once, then normalize in place so no further full-size temporaries are allocated.
+    output_array = array.astype(np.float32)
+    output_array /= 255.0
+    output_array -= mean
+    output_array /= std
 
     return output_array
 
@@ -689,15 +693,14 @@ def base64_to_numpy(base64_string: str) -> np.ndarray:
 
         # Convert BGR to RGB for consistent processing (OpenCV loads as BGR)
         # Only convert if it's a 3-channel color image
+        # The conversion is done in place; `img` is a fresh buffer owned by this function.
         if img.ndim == 3 and img.shape[2] == 3:
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
     except ImportError:
         raise
     except Exception as e:
         raise ValueError("Unable to decode image from base64 string") from e
 
-    # Convert to numpy array
-    img = np.array(img)
     # Assert that 3-channel images are in RGB format after conversion
     assert img.ndim <= 3, f"Image has unexpected number of dimensions: {img.ndim}"
     assert img.ndim != 3 or img.shape[2] == 3, f"3-channel image should have 3 channels, got: {img.shape[2]}"